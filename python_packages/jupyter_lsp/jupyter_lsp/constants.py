@@ -11,3 +11,6 @@ EP_LISTENER_SERVER_V1 = "jupyter_lsp_listener_server_v1"
 
 # jupyter*config.d where language_servers can be defined
 APP_CONFIG_D_SECTIONS = ["_", "_notebook_", "_server_"]
+
+# where the last autodetected language servers are cached, in the jupyter data dir
+AUTODETECT_CACHE_FILE = "autodetected_language_servers.json"
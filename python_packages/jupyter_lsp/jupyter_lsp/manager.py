@@ -2,50 +2,132 @@
 """
 
 import asyncio
+import concurrent.futures
+import inspect
+import itertools
+import json
 import os
+import pathlib
 import sys
 import traceback
-from typing import Dict, Text, Tuple, cast
-
-# See compatibility note on `group` keyword in
-# https://docs.python.org/3/library/importlib.metadata.html#entry-points
-if sys.version_info < (3, 10):  # pragma: no cover
-    from importlib_metadata import entry_points
-else:  # pragma: no cover
-    from importlib.metadata import entry_points
-
-from jupyter_core.paths import jupyter_config_path
-from jupyter_server.services.config import ConfigManager
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Text,
+    Tuple,
+    cast,
+)
 
 try:
     from jupyter_server.transutils import _i18n as _
 except ImportError:  # pragma: no cover
     from jupyter_server.transutils import _
 
-from traitlets import Bool
+from traitlets import Bool, Bunch
 from traitlets import Dict as Dict_
 from traitlets import Instance
 from traitlets import List as List_
-from traitlets import Unicode, default
+from traitlets import Unicode, default, observe
 
+from ._version import __version__
 from .constants import (
     APP_CONFIG_D_SECTIONS,
+    AUTODETECT_CACHE_FILE,
     EP_LISTENER_ALL_V1,
     EP_LISTENER_CLIENT_V1,
     EP_LISTENER_SERVER_V1,
     EP_SPEC_V1,
 )
 from .schema import LANGUAGE_SERVER_SPEC_MAP
-from .session import LanguageServerSession
 from .trait_types import LoadableCallable, Schema
 from .types import (
     KeyedLanguageServerSpecs,
     LanguageServerManagerAPI,
+    LanguageServerSpec,
     MessageScope,
     SpecBase,
     SpecMaker,
 )
 
+# heavier imports are deferred until they are needed, as this module is imported
+# while the server extension is being loaded
+if TYPE_CHECKING:  # pragma: no cover
+    from importlib.metadata import EntryPoint
+
+    from .session import LanguageServerSession
+
+# a language server spec found by a spec finder, and whether it is installed
+AutodetectedSpec = Tuple[Text, LanguageServerSpec, bool]
+
+# the listener traits and entry point groups for each message scope
+_LISTENER_SCOPES: Tuple[Tuple[MessageScope, Text, Text], ...] = (
+    (MessageScope.ALL, "all_listeners", EP_LISTENER_ALL_V1),
+    (MessageScope.CLIENT, "client_listeners", EP_LISTENER_CLIENT_V1),
+    (MessageScope.SERVER, "server_listeners", EP_LISTENER_SERVER_V1),
+)
+
+# entry points only change when packages are (un)installed, so scan each group once
+_EP_CACHE: Dict[Text, Tuple["EntryPoint", ...]] = {}
+
+
+def _cached_entry_points(group: Text) -> Tuple["EntryPoint", ...]:
+    """get the entry points in a group, scanning installed distributions once"""
+    if group not in _EP_CACHE:
+        # See compatibility note on `group` keyword in
+        # https://docs.python.org/3/library/importlib.metadata.html#entry-points
+        if sys.version_info < (3, 10):  # pragma: no cover
+            from importlib_metadata import entry_points
+        else:  # pragma: no cover
+            from importlib.metadata import entry_points
+
+        _EP_CACHE[group] = tuple(entry_points(group=group))
+    return _EP_CACHE[group]
+
+
+def _normalized(value: Any) -> Any:
+    """make a JSON-compatible value comparable with one round-tripped via JSON"""
+    return json.loads(json.dumps(value))
+
+
+def _site_packages_dirs() -> List[Text]:
+    """get the directories packages are installed in, but not the rest of sys.path,
+    which may include the (often changing) directory the server was launched from
+    """
+    import site
+
+    # some virtualenvs ship a `site` without `getsitepackages`
+    dirs = list(getattr(site, "getsitepackages", lambda: [])())
+    dirs.append(site.getusersitepackages())
+    return [path for path in dirs if os.path.isdir(path)]
+
+
+@lru_cache(maxsize=4)
+def _load_conf_d_language_servers(
+    config_path: Tuple[Text, ...], class_name: Text
+) -> KeyedLanguageServerSpecs:
+    """read the language servers from all conf.d sections, once per config path"""
+    from jupyter_server.services.config import ConfigManager
+
+    language_servers: KeyedLanguageServerSpecs = {}
+
+    manager = ConfigManager(read_config_path=list(config_path))
+
+    for app in APP_CONFIG_D_SECTIONS:
+        language_servers.update(
+            **manager.get(f"jupyter{app}config")
+            .get(class_name, {})
+            .get("language_servers", {})
+        )
+
+    return language_servers
+
 
 class LanguageServerManager(LanguageServerManagerAPI):
     """Manage language servers"""
@@ -66,9 +148,18 @@ class LanguageServerManager(LanguageServerManagerAPI):
         True, help=_("try to find known language servers in sys.prefix (and elsewhere)")
     ).tag(config=True)
 
-    sessions: Dict[Tuple[Text], LanguageServerSession] = (
+    autodetect_cache: bool = Bool(  # type:ignore[assignment]
+        True,
+        help=_(
+            "on server start, use the autodetected language servers cached in the"
+            " jupyter data dir by the last start if its environment still matches,"
+            " and refresh them in the background"
+        ),
+    ).tag(config=True)
+
+    sessions: Dict[Tuple[Text], "LanguageServerSession"] = (
         Dict_(  # type:ignore[assignment]
-            trait=Instance(LanguageServerSession),
+            trait=Instance("jupyter_lsp.session.LanguageServerSession"),
             default_value={},
             help="sessions keyed by language server name",
         )
@@ -107,83 +198,266 @@ class LanguageServerManager(LanguageServerManagerAPI):
 
     @default("conf_d_language_servers")
     def _default_conf_d_language_servers(self) -> KeyedLanguageServerSpecs:
-        language_servers: KeyedLanguageServerSpecs = {}
+        from jupyter_core.paths import jupyter_config_path
 
-        manager = ConfigManager(read_config_path=jupyter_config_path())
-
-        for app in APP_CONFIG_D_SECTIONS:
-            language_servers.update(
-                **manager.get(f"jupyter{app}config")
-                .get(self.__class__.__name__, {})
-                .get("language_servers", {})
+        return dict(
+            _load_conf_d_language_servers(
+                tuple(jupyter_config_path()), self.__class__.__name__
             )
-
-        return language_servers
+        )
 
     def __init__(self, **kwargs: Dict):
         """Before starting, perform all necessary configuration"""
         self.all_language_servers: KeyedLanguageServerSpecs = {}
-        self._language_servers_from_config: KeyedLanguageServerSpecs = {}
+        self._language_servers_from_config: Mapping[Text, LanguageServerSpec] = (
+            MappingProxyType({})
+        )
+        self._all_autodetected: List[AutodetectedSpec] = []
+        self._autodetect_refresh: Optional[asyncio.Future] = None
+        self._session_to_key: Dict[int, Text] = {}
+        self._ready_event: Optional[asyncio.Event] = None
+        self._ready_loop: Optional[asyncio.AbstractEventLoop] = None
         super().__init__(**kwargs)
 
-    def initialize(self, *args, **kwargs):
-        self.init_language_servers()
+    def initialize(self, *args, autodetected=None, **kwargs):
+        self.init_language_servers(autodetected=autodetected)
         self.init_listeners()
         self.init_sessions()
         self._ready = True
 
+    async def async_initialize(self):
+        """initialize off the event loop, as spec finders may block on subprocesses
+
+        With `autodetect_cache`, become ready with the cached autodetected specs
+        (if any), and then refresh them and the cache in the background.
+        """
+        loop = asyncio.get_running_loop()
+        use_cache = self.autodetect and self.autodetect_cache
+        cached = None
+
+        with concurrent.futures.ThreadPoolExecutor() as pool:
+            if use_cache:
+                cached = await loop.run_in_executor(pool, self._read_autodetect_cache)
+            await loop.run_in_executor(
+                pool, partial(self.initialize, autodetected=cached)
+            )
+
+        if use_cache:
+            self._autodetect_refresh = asyncio.ensure_future(
+                self._refresh_autodetected(stale=cached is not None)
+            )
+            self._autodetect_refresh.add_done_callback(self._on_autodetect_refreshed)
+
     async def ready(self):
-        while not self._ready:  # pragma: no cover
-            await asyncio.sleep(0.1)
+        if not self._ready:  # pragma: no cover
+            if self._ready_event is None:
+                self._ready_loop = asyncio.get_running_loop()
+                self._ready_event = asyncio.Event()
+            # `initialize` may have finished on another thread in the meantime
+            if not self._ready:
+                await self._ready_event.wait()
         return True
 
-    def init_language_servers(self) -> None:
+    @observe("_ready")
+    def _on_ready(self, change: Bunch):
+        """wake up anybody waiting in `ready`, possibly from another thread"""
+        if change["new"] and self._ready_event is not None:  # pragma: no cover
+            cast(asyncio.AbstractEventLoop, self._ready_loop).call_soon_threadsafe(
+                self._ready_event.set
+            )
+
+    def init_language_servers(
+        self, autodetected: Optional[List[AutodetectedSpec]] = None
+    ) -> None:
         """determine the final language server configuration."""
-        # copy the language servers before anybody monkeys with them
-        self._language_servers_from_config = dict(self.language_servers)
-        self.language_servers = self._collect_language_servers(only_installed=True)
-        self.all_language_servers = self._collect_language_servers(only_installed=False)
+        # keep a read-only view of the configured language servers: the trait is
+        # about to be re-assigned, so the original dict needs no copy
+        self._language_servers_from_config = MappingProxyType(self.language_servers)
+        # run the (potentially slow) spec finders only once for both views
+        if autodetected is None:
+            autodetected = (
+                list(self._autodetect_language_servers()) if self.autodetect else []
+            )
+        self._apply_autodetected(autodetected)
+
+    def _apply_autodetected(self, autodetected: List[AutodetectedSpec]) -> None:
+        """merge autodetected specs with the configured language servers"""
+        self._all_autodetected = autodetected
+        language_servers, self.all_language_servers = self._collect_language_servers()
+
+        # every layer has already been validated, by the traits holding the config
+        # or as it was autodetected, so skip walking the merged specs again
+        old = self._trait_values.get("language_servers")
+        self._trait_values["language_servers"] = language_servers
+        self._notify_trait("language_servers", old, language_servers)
+
+    async def _refresh_autodetected(self, stale: bool) -> None:
+        """re-run autodetection if the specs came from the cache, then update it"""
+        loop = asyncio.get_running_loop()
+
+        with concurrent.futures.ThreadPoolExecutor() as pool:
+            if stale:
+                fresh = await loop.run_in_executor(
+                    pool, lambda: list(self._autodetect_language_servers())
+                )
+                if _normalized(fresh) != _normalized(self._all_autodetected):
+                    self.log.info(_("[lsp] Autodetected language servers changed"))
+                    self._apply_autodetected(fresh)
+                    self.init_sessions()
+            await loop.run_in_executor(pool, self._write_autodetect_cache)
+
+    def _on_autodetect_refreshed(self, future: asyncio.Future):
+        """log a failed background refresh, as nothing else awaits it"""
+        if future.cancelled():  # pragma: no cover
+            return
+        err = future.exception()
+        if err is not None:  # pragma: no cover
+            self.log.warning(
+                _("[lsp] Failed to refresh autodetected language servers: %s"), err
+            )
+
+    @property
+    def _autodetect_cache_path(self) -> pathlib.Path:
+        from jupyter_core.paths import jupyter_data_dir
+
+        return pathlib.Path(jupyter_data_dir()) / "jupyter_lsp" / AUTODETECT_CACHE_FILE
+
+    def _autodetect_fingerprint(self) -> Dict[Text, Any]:
+        """describe the environment which autodetection depends on, cheaply"""
+        return _normalized(
+            {
+                "version": __version__,
+                "prefix": sys.prefix,
+                "path": os.environ.get("PATH", ""),
+                "cwd": os.getcwd(),
+                "extra_node_roots": [str(root) for root in self.extra_node_roots],
+                "entry_points": sorted(
+                    f"{ep.name}={ep.value}"
+                    for ep in _cached_entry_points(EP_SPEC_V1)
+                ),
+                # (un)installing a package touches its site-packages directory
+                "site_packages_mtime": max(
+                    (os.stat(p).st_mtime for p in _site_packages_dirs()),
+                    default=0,
+                ),
+            }
+        )
+
+    def _read_autodetect_cache(self) -> Optional[List[AutodetectedSpec]]:
+        """get the cached autodetected specs, if they match this environment"""
+        path = self._autodetect_cache_path
+
+        try:
+            cache = json.loads(path.read_text(encoding="utf-8"))
+            if cache["fingerprint"] != self._autodetect_fingerprint():
+                return None
+            autodetected = [
+                (key, spec, bool(installed))
+                for key, spec, installed in cache["autodetected"]
+            ]
+            # these are merged without further validation, so check them here
+            for key, spec, installed in autodetected:
+                error = next(LANGUAGE_SERVER_SPEC_MAP.iter_errors({key: spec}), None)
+                if error is not None:
+                    raise ValueError(error.message)
+            return autodetected
+        except FileNotFoundError:
+            return None
+        except Exception as err:  # pragma: no cover
+            self.log.debug("[lsp] Ignoring unreadable cache %s: %s", path, err)
+            return None
+
+    def _write_autodetect_cache(self) -> None:
+        path = self._autodetect_cache_path
+        cache = {
+            "fingerprint": self._autodetect_fingerprint(),
+            "autodetected": self._all_autodetected,
+        }
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(cache), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except Exception as err:  # pragma: no cover
+            self.log.debug("[lsp] Could not write cache %s: %s", path, err)
 
     def _collect_language_servers(
-        self, only_installed: bool
-    ) -> KeyedLanguageServerSpecs:
+        self,
+    ) -> Tuple[KeyedLanguageServerSpecs, KeyedLanguageServerSpecs]:
+        """merge autodetected and configured specs into the installed and all
+        language servers, in a single pass
+        """
         language_servers: KeyedLanguageServerSpecs = {}
+        all_language_servers: KeyedLanguageServerSpecs = {}
 
-        language_servers_from_config = dict(self._language_servers_from_config)
-        language_servers_from_config.update(self.conf_d_language_servers)
-
-        if self.autodetect:
-            language_servers.update(
-                self._autodetect_language_servers(only_installed=only_installed)
+        configured = (
+            (key, spec, True)
+            for key, spec in itertools.chain(
+                self._language_servers_from_config.items(),
+                self.conf_d_language_servers.items(),
             )
+        )
 
-        # restore config
-        language_servers.update(language_servers_from_config)
+        # later sources win: config (and then conf.d) override autodetected specs
+        for key, spec, is_installed in itertools.chain(
+            self._all_autodetected, configured
+        ):
+            targets = (
+                (language_servers, all_language_servers)
+                if is_installed
+                else (all_language_servers,)
+            )
+            for target in targets:
+                if spec.get("argv"):
+                    target[key] = spec
+                else:
+                    # allow a user to opt-out by specifying `[]`
+                    target.pop(key, None)
 
-        # coalesce the servers, allowing a user to opt-out by specifying `[]`
-        return {key: spec for key, spec in language_servers.items() if spec.get("argv")}
+        return language_servers, all_language_servers
 
     def init_sessions(self):
         """create, but do not initialize all sessions"""
+        from .session import LanguageServerSession
+
+        previous = dict(self.sessions)
         sessions = {}
         for language_server, spec in self.language_servers.items():
-            sessions[language_server] = LanguageServerSession(
-                language_server=language_server, spec=spec, parent=self
-            )
+            session = previous.pop(language_server, None)
+            # keep sessions which are unchanged, or still in use: the latter are
+            # replaced once their last handler unsubscribes, see `unsubscribe`
+            if session is None or (session.spec != spec and not session.handlers):
+                if session is not None:
+                    session.dispose()
+                session = LanguageServerSession(
+                    language_server=language_server, spec=spec, parent=self
+                )
+            sessions[language_server] = session
+
+        for language_server, session in previous.items():
+            if session.handlers:
+                # still in use by some editor: released once its last handler
+                # unsubscribes, see `unsubscribe`
+                sessions[language_server] = session
+            else:
+                session.dispose()
+
         self.sessions = sessions
 
+    @observe("sessions")
+    def _on_sessions(self, change: Bunch):
+        """keep the reverse index of sessions in step with however they are set"""
+        self._session_to_key = {id(sess): key for key, sess in change["new"].items()}
+
     def init_listeners(self):
         """register traitlets-configured listeners"""
 
-        scopes = {
-            MessageScope.ALL: [self.all_listeners, EP_LISTENER_ALL_V1],
-            MessageScope.CLIENT: [self.client_listeners, EP_LISTENER_CLIENT_V1],
-            MessageScope.SERVER: [self.server_listeners, EP_LISTENER_SERVER_V1],
-        }
-        for scope, trt_ep in scopes.items():
-            listeners, entry_point = trt_ep
+        for scope, trait_name, entry_point in _LISTENER_SCOPES:
+            # load into a local list, rather than growing the configured trait
+            listeners = list(getattr(self, trait_name))
 
-            for ept in entry_points(group=entry_point):  # pragma: no cover
+            for ept in _cached_entry_points(entry_point):  # pragma: no cover
                 try:
                     listeners.append(ept.load())
                 except Exception as err:
@@ -204,12 +478,14 @@ class LanguageServerManager(LanguageServerManagerAPI):
             )
             return
 
-        session.handlers = set([handler]) | session.handlers
+        session.add_handler(handler)
 
     async def on_client_message(self, message, handler):
-        await self.wait_for_listeners(
-            MessageScope.CLIENT, message, handler.language_server
-        )
+        # most deployments have no listeners: skip straight to the session
+        if self.has_listeners(MessageScope.CLIENT):
+            await self.wait_for_listeners(
+                MessageScope.CLIENT, message, handler.language_server
+            )
         session = self.sessions.get(handler.language_server)
 
         if session is None:
@@ -223,17 +499,44 @@ class LanguageServerManager(LanguageServerManagerAPI):
         session.write(message)
 
     async def on_server_message(self, message, session):
-        language_servers = [
-            ls_key for ls_key, sess in self.sessions.items() if sess == session
-        ]
+        if not isinstance(message, (str, bytes)):
+            # serialize once here, rather than in `write_message` for every handler
+            message = json.dumps(message, separators=(",", ":"))
 
-        for language_servers in language_servers:
-            await self.wait_for_listeners(
-                MessageScope.SERVER, message, language_servers
-            )
+        ls_key = self._session_to_key.get(id(session))
 
-        for handler in session.handlers:
-            handler.write_message(message)
+        if ls_key is None:
+            # e.g. a session replaced while it still had messages queued
+            self.log.debug("[lsp] dropped message from a detached session")
+            return
+
+        if self.has_listeners(MessageScope.SERVER):
+            await self.wait_for_listeners(MessageScope.SERVER, message, ls_key)
+
+        for handler in tuple(session.handlers):
+            try:
+                written = handler.write_message(message)
+            except Exception as err:  # pragma: no cover
+                self.log.warning(
+                    "[{}] failed to write message to handler: {}".format(ls_key, err)
+                )
+                continue
+            if inspect.isawaitable(written):
+                # don't wait for the write to be flushed: one slow client would
+                # otherwise hold back every later message for all the others
+                asyncio.ensure_future(written).add_done_callback(
+                    partial(self._on_handler_written, ls_key)
+                )
+
+    def _on_handler_written(self, ls_key: Text, future: asyncio.Future):
+        """log a failed write to a handler, once it has finished"""
+        if future.cancelled():  # pragma: no cover
+            return
+        err = future.exception()
+        if err is not None:  # pragma: no cover
+            self.log.warning(
+                "[{}] failed to write message to handler: {}".format(ls_key, err)
+            )
 
     def unsubscribe(self, handler):
         session = self.sessions.get(handler.language_server)
@@ -246,61 +549,131 @@ class LanguageServerManager(LanguageServerManagerAPI):
             )
             return
 
-        session.handlers = [h for h in session.handlers if h != handler]
+        session.remove_handler(handler)
+
+        if (
+            not session.handlers
+            and self.language_servers.get(handler.language_server) != session.spec
+        ):
+            # its language server was dropped, or its spec changed, while it was
+            # still in use: release or replace it now
+            self.init_sessions()
+
+    def _find_specs(
+        self, ep_name: Text, spec_finder: SpecMaker
+    ) -> Optional[Tuple[bool, KeyedLanguageServerSpecs]]:
+        """check whether a spec finder's server is installed, and get its specs"""
+        is_installed = True
 
-    def _autodetect_language_servers(self, only_installed: bool):
+        if hasattr(spec_finder, "is_installed"):
+            spec_finder_from_base = cast(SpecBase, spec_finder)
+            try:
+                is_installed = bool(spec_finder_from_base.is_installed(self))
+            except Exception as err:  # pragma: no cover
+                self.log.warning(
+                    _(
+                        "Failed to check installation from language server spec"
+                        " finder `{}`:\n{}"
+                    ).format(ep_name, err)
+                )
+                is_installed = False
+
+        try:
+            specs = spec_finder(self) or {}
+        except Exception as err:  # pragma: no cover
+            self.log.warning(
+                _(
+                    "Failed to fetch commands from language server spec finder"
+                    " `{}`:\n{}"
+                ).format(ep_name, err)
+            )
+            traceback.print_exc()
+            return None
+
+        return is_installed, specs
+
+    def _autodetect_language_servers(
+        self,
+    ) -> Iterator[AutodetectedSpec]:
+        """yield `(key, spec, is_installed)` for every spec finder entry point"""
         _entry_points = None
 
         try:
-            _entry_points = entry_points(group=EP_SPEC_V1)
+            _entry_points = _cached_entry_points(EP_SPEC_V1)
         except Exception:  # pragma: no cover
             self.log.exception("Failed to load entry_points")
 
-        skipped_servers = []
+        spec_finders: List[Tuple[Text, SpecMaker]] = []
 
         for ep in _entry_points or []:
             try:
-                spec_finder: SpecMaker = ep.load()
+                spec_finders.append((ep.name, ep.load()))
             except Exception as err:  # pragma: no cover
                 self.log.warning(
                     _("Failed to load language server spec finder `{}`: \n{}").format(
                         ep.name, err
                     )
                 )
-                continue
 
-            try:
-                if only_installed:
-                    if hasattr(spec_finder, "is_installed"):
-                        spec_finder_from_base = cast(SpecBase, spec_finder)
-                        if not spec_finder_from_base.is_installed(self):
-                            skipped_servers.append(ep.name)
-                            continue
-                specs = spec_finder(self) or {}
-            except Exception as err:  # pragma: no cover
-                self.log.warning(
-                    _(
-                        "Failed to fetch commands from language server spec finder"
-                        " `{}`:\n{}"
-                    ).format(ep.name, err)
-                )
-                traceback.print_exc()
+        if not spec_finders:  # pragma: no cover
+            return
+
+        # resolve the lazy defaults shared by many finders once, up front, rather
+        # than racing to compute them in every thread
+        for trait_name in ["nodejs", "node_roots"]:
+            getattr(self, trait_name)
+
+        # finders mostly wait on the filesystem and subprocesses, so run them
+        # concurrently, but keep the results in entry point order
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(8, len(spec_finders))
+        ) as pool:
+            futures = [
+                (ep_name, pool.submit(self._find_specs, ep_name, spec_finder))
+                for ep_name, spec_finder in spec_finders
+            ]
+            found_specs = [(ep_name, future.result()) for ep_name, future in futures]
 
+        skipped_servers = []
+
+        for ep_name, found in found_specs:
+            if found is None:  # pragma: no cover
                 continue
 
-            errors = list(LANGUAGE_SERVER_SPEC_MAP.iter_errors(specs))
+            is_installed, specs = found
+
+            if not is_installed:
+                skipped_servers.append(ep_name)
 
-            if errors:  # pragma: no cover
+            if not isinstance(specs, dict):  # pragma: no cover
                 self.log.warning(
                     _(
                         "Failed to validate commands from language server spec finder"
                         " `{}`:\n{}"
-                    ).format(ep.name, errors)
+                    ).format(ep_name, list(LANGUAGE_SERVER_SPEC_MAP.iter_errors(specs)))
                 )
                 continue
 
+            # validate and yield each spec as it comes, so one bad spec doesn't
+            # discard the rest from the same finder
             for key, spec in specs.items():
-                yield key, spec
+                keyed_spec = {key: spec}
+                first_error = next(
+                    LANGUAGE_SERVER_SPEC_MAP.iter_errors(keyed_spec), None
+                )
+
+                if first_error is not None:  # pragma: no cover
+                    # only pay for collecting every error when there is one to report
+                    errors = list(LANGUAGE_SERVER_SPEC_MAP.iter_errors(keyed_spec))
+                    self.log.warning(
+                        _(
+                            "Failed to validate commands from language server spec"
+                            " finder `{}`:\n{}"
+                        ).format(ep_name, errors)
+                    )
+                    continue
+
+                yield key, spec, is_installed
 
         if skipped_servers:
             self.log.info(
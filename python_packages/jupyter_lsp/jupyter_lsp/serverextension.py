@@ -12,34 +12,51 @@ from .manager import LanguageServerManager
 from .paths import normalized_uri
 
 
-async def initialize(nbapp, virtual_documents_uri):  # pragma: no cover
-    """Perform lazy initialization."""
-    import concurrent.futures
-
+def watch_shadow_filesystem(nbapp, manager, virtual_documents_uri):
+    """set up the shadow filesystem once any server needs documents on disk, now
+    or after the language servers change, e.g. when cached specs are refreshed
+    """
     from .virtual_documents_shadow import setup_shadow_filesystem
 
-    manager: LanguageServerManager = nbapp.language_server_manager
+    shadow_filesystem_ready = False
 
-    with concurrent.futures.ThreadPoolExecutor() as pool:
-        await nbapp.io_loop.run_in_executor(pool, manager.initialize)
+    def maybe_setup_shadow_filesystem(*args):
+        nonlocal shadow_filesystem_ready
 
-    servers_requiring_disk_access = [
-        server_id
-        for server_id, server in manager.language_servers.items()
-        if server.get("requires_documents_on_disk", True)
-    ]
+        # every setup registers another listener, so only ever set up once
+        if shadow_filesystem_ready:
+            return
 
-    if any(servers_requiring_disk_access):
-        nbapp.log.debug(
-            "[lsp] Servers that requested virtual documents on disk: %s",
-            servers_requiring_disk_access,
-        )
-        setup_shadow_filesystem(virtual_documents_uri=virtual_documents_uri)
-    else:
-        nbapp.log.debug(
-            "[lsp] None of the installed servers require virtual documents"
-            " disabling shadow filesystem."
-        )
+        servers_requiring_disk_access = [
+            server_id
+            for server_id, server in manager.language_servers.items()
+            if server.get("requires_documents_on_disk", True)
+        ]
+
+        if any(servers_requiring_disk_access):
+            nbapp.log.debug(
+                "[lsp] Servers that requested virtual documents on disk: %s",
+                servers_requiring_disk_access,
+            )
+            setup_shadow_filesystem(virtual_documents_uri=virtual_documents_uri)
+            shadow_filesystem_ready = True
+        else:
+            nbapp.log.debug(
+                "[lsp] None of the installed servers require virtual documents"
+                " disabling shadow filesystem."
+            )
+
+    maybe_setup_shadow_filesystem()
+    manager.observe(maybe_setup_shadow_filesystem, "language_servers")
+
+
+async def initialize(nbapp, virtual_documents_uri):  # pragma: no cover
+    """Perform lazy initialization."""
+    manager: LanguageServerManager = nbapp.language_server_manager
+
+    await manager.async_initialize()
+
+    watch_shadow_filesystem(nbapp, manager, virtual_documents_uri)
 
     nbapp.log.debug(
         "[lsp] The following Language Servers will be available: {}".format(
@@ -41,7 +41,7 @@ class LanguageServerSession(LoggingConfigurable):
     )
     handlers = Set(
         trait=Instance(WebSocketHandler),
-        default_value=[],
+        default_value=set(),
         help="the currently subscribed websockets",
     )
     status = UseEnum(SessionStatus, default_value=SessionStatus.NOT_STARTED)
@@ -113,9 +113,15 @@ class LanguageServerSession(LoggingConfigurable):
 
         if self._tasks:
             [task.cancel() for task in self._tasks]
+            self._tasks = None
 
         self.status = SessionStatus.STOPPED
 
+    def dispose(self):
+        """stop, and release this session for good, e.g. when it is replaced"""
+        self.stop()
+        atexit.unregister(self.stop)
+
     @observe("handlers")
     def _on_handlers(self, change: Bunch):
         """re-initialize if someone starts listening, or stop if nobody is"""
@@ -124,6 +130,22 @@ class LanguageServerSession(LoggingConfigurable):
         elif not change["new"] and self.process:
             self.stop()
 
+    def add_handler(self, handler: WebSocketHandler):
+        """subscribe a handler in place, notifying only if it is new"""
+        if handler in self.handlers:
+            return
+        old = set(self.handlers)
+        self.handlers.add(handler)
+        self._notify_trait("handlers", old, self.handlers)
+
+    def remove_handler(self, handler: WebSocketHandler):
+        """unsubscribe a handler in place, notifying only if it was present"""
+        if handler not in self.handlers:
+            return
+        old = set(self.handlers)
+        self.handlers.discard(handler)
+        self._notify_trait("handlers", old, self.handlers)
+
     def write(self, message):
         """wrapper around the write queue to keep it mostly internal"""
         self.last_handler_message_at = self.now()
@@ -3,7 +3,7 @@ import shutil
 import sys
 from pathlib import Path
 from subprocess import check_output
-from typing import List, Text, Union
+from typing import List, Optional, Text, Union
 
 from ..schema import SPEC_VERSION
 from ..types import (
@@ -33,29 +33,32 @@ class ShellSpec(SpecBase):  # pragma: no cover
     # is installed, or nothing if it is missing and user action is required.
     is_installed_args: List[Token] = []
 
-    def is_installed(self, mgr: LanguageServerManagerAPI) -> bool:
-        cmd = self.solve()
+    def is_installed(self, mgr: Optional[LanguageServerManagerAPI]) -> bool:
+        cmd = self.solve(mgr)
 
         if not cmd:
             return False
 
         if not self.is_installed_args:
             return bool(cmd)
-        else:
+        elif mgr is None:
             check_result = check_output([cmd, *self.is_installed_args]).decode(
                 encoding="utf-8"
             )
             return check_result != ""
+        else:
+            return bool(mgr.check_output([cmd, *self.is_installed_args]))
 
-    def solve(self) -> Union[str, None]:
+    def solve(self, mgr: Optional[LanguageServerManagerAPI] = None) -> Union[str, None]:
+        which = mgr.which if mgr is not None else shutil.which
         for ext in ["", ".cmd", ".bat", ".exe"]:
-            cmd = shutil.which(self.cmd + ext)
+            cmd = which(self.cmd + ext)
             if cmd:
                 break
         return cmd
 
     def __call__(self, mgr: LanguageServerManagerAPI) -> KeyedLanguageServerSpecs:
-        cmd = self.solve()
+        cmd = self.solve(mgr)
 
         spec = dict(self.spec)
 
@@ -1,6 +1,21 @@
+from jupyter_lsp import LanguageServerManager
+
+
 def test_conf_d_language_servers(echo_conf_json, handlers, app_config_d):
     (app_config_d / "echo.json").write_text(echo_conf_json)
     handler, ws_handler = handlers
     manager = handler.manager
     manager.initialize()
     assert "_echo_" in [*manager.language_servers]
+
+
+def test_conf_d_language_servers_read_once(echo_conf_json, app_config_d):
+    """should only read conf.d once for managers sharing a config path"""
+    (app_config_d / "echo.json").write_text(echo_conf_json)
+    first = LanguageServerManager().conf_d_language_servers
+    assert "_echo_" in first
+
+    (app_config_d / "echo.json").unlink()
+    second = LanguageServerManager().conf_d_language_servers
+    assert second == first
+    assert second is not first
@@ -1,3 +1,9 @@
+import os
+
+import pytest
+
+from jupyter_lsp.constants import EP_SPEC_V1
+from jupyter_lsp.manager import _cached_entry_points
 from jupyter_lsp.specs.r_languageserver import RLanguageServer
 from jupyter_lsp.specs.utils import PythonModuleSpec
 
@@ -15,6 +21,34 @@ def test_detect(manager):
     assert len(manager.sessions) == len(manager.language_servers)
 
 
+def test_detect_installed_subset(manager):
+    """installed servers should be found in the same pass as all servers"""
+    manager.initialize()
+    assert manager._all_autodetected
+    assert set(manager.language_servers) <= set(manager.all_language_servers)
+
+
+def test_entry_points_cached():
+    """should only scan installed distributions once per group"""
+    first = _cached_entry_points(EP_SPEC_V1)
+    assert first
+    assert _cached_entry_points(EP_SPEC_V1) is first
+
+
+def test_which_cached(manager, monkeypatch):
+    """should only look up an executable once per manager"""
+    calls = []
+
+    def fake_which(cmd):
+        calls.append(cmd)
+        return f"/usr/bin/{cmd}"
+
+    monkeypatch.setattr("jupyter_lsp.types.shutil.which", fake_which)
+    assert manager.which("not-a-real-cmd") == "/usr/bin/not-a-real-cmd"
+    assert manager.which("not-a-real-cmd") == "/usr/bin/not-a-real-cmd"
+    assert calls == ["not-a-real-cmd"]
+
+
 def test_r_package_detection():
     with_installed_server = RLanguageServer()
     assert with_installed_server.is_installed(mgr=None) is True
@@ -39,3 +73,68 @@ def test_missing_python_module_spec():
 
     # we ant the spec even when not installed
     assert "languages" in not_installed_server(mgr=None)["a_module"]
+
+
+def test_autodetect_cache(manager, tmp_path, monkeypatch):
+    """should read back the autodetected specs only for a matching environment"""
+    monkeypatch.setenv("JUPYTER_DATA_DIR", str(tmp_path))
+    assert manager._read_autodetect_cache() is None
+
+    manager.initialize()
+    manager._write_autodetect_cache()
+    cached = manager._read_autodetect_cache()
+    assert [key for key, spec, installed in cached] == [
+        key for key, spec, installed in manager._all_autodetected
+    ]
+
+    monkeypatch.setenv("PATH", str(tmp_path))
+    assert manager._read_autodetect_cache() is None
+
+
+@pytest.mark.asyncio
+async def test_autodetect_cache_refreshed(manager, echo_spec, tmp_path, monkeypatch):
+    """should become ready with the cached specs, then drop stale ones on refresh"""
+    monkeypatch.setenv("JUPYTER_DATA_DIR", str(tmp_path))
+    detected = list(manager._autodetect_language_servers())
+    manager._all_autodetected = [*detected, ("_cached_", echo_spec, True)]
+    manager._write_autodetect_cache()
+
+    await manager.async_initialize()
+    assert "_cached_" in manager.language_servers
+    assert "_cached_" in manager.sessions
+
+    await manager._autodetect_refresh
+    assert "_cached_" not in manager.language_servers
+    assert "_cached_" not in manager.sessions
+    cached = manager._read_autodetect_cache()
+    assert "_cached_" not in [key for key, spec, installed in cached]
+
+
+def test_autodetect_cache_ignores_sys_path(manager, tmp_path, monkeypatch):
+    """should keep the cache when a directory on sys.path, but not an install
+    location, changes, e.g. the directory the server was launched from
+    """
+    monkeypatch.setenv("JUPYTER_DATA_DIR", str(tmp_path / "data"))
+    launch_dir = tmp_path / "launch"
+    launch_dir.mkdir()
+    monkeypatch.syspath_prepend(str(launch_dir))
+
+    manager.initialize()
+    manager._write_autodetect_cache()
+
+    (launch_dir / "Untitled.ipynb").write_text("{}", encoding="utf-8")
+    later = launch_dir.stat().st_mtime + 60
+    os.utime(launch_dir, (later, later))
+    assert manager._read_autodetect_cache() is not None
+
+
+def test_collect_opt_out(manager, echo_spec):
+    """should let config opt out of autodetected servers, and keep missing ones"""
+    manager.language_servers = {"_opted_out_": {**echo_spec, "argv": []}}
+    manager.init_language_servers(
+        autodetected=[("_opted_out_", echo_spec, True), ("_missing_", echo_spec, False)]
+    )
+    assert "_opted_out_" not in manager.language_servers
+    assert "_opted_out_" not in manager.all_language_servers
+    assert "_missing_" not in manager.language_servers
+    assert "_missing_" in manager.all_language_servers
@@ -1,4 +1,6 @@
+import logging
 import os
+from types import SimpleNamespace
 
 
 def test_serverextension_path(app):
@@ -47,3 +49,31 @@ def test_virtual_documents_dir_env(app):
         ["--ServerApp.jpserver_extensions={'jupyter_lsp.serverextension': True}"]
     )
     assert app.language_server_manager.virtual_documents_dir == custom_dir
+
+
+def test_shadow_filesystem_after_refresh(manager, echo_spec, tmp_path, monkeypatch):
+    """should set the shadow filesystem up once a server needs it, even later"""
+    from jupyter_lsp import virtual_documents_shadow
+    from jupyter_lsp.serverextension import watch_shadow_filesystem
+
+    setups = []
+    monkeypatch.setattr(
+        virtual_documents_shadow,
+        "setup_shadow_filesystem",
+        lambda virtual_documents_uri: setups.append(virtual_documents_uri),
+    )
+    nbapp = SimpleNamespace(log=logging.getLogger(__name__))
+
+    manager.language_servers = {
+        "_echo_": {**echo_spec, "requires_documents_on_disk": False}
+    }
+    watch_shadow_filesystem(nbapp, manager, tmp_path.as_uri())
+    assert not setups
+
+    # e.g. a server requiring documents on disk appears after a refresh
+    manager.language_servers = {"_echo_": echo_spec}
+    assert setups == [tmp_path.as_uri()]
+
+    # ...but the shadow filesystem is only ever set up once
+    manager.language_servers = {"_echo_": echo_spec, "_echo2_": echo_spec}
+    assert len(setups) == 1
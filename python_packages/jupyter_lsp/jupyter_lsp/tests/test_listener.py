@@ -116,3 +116,31 @@ async def test_listeners(known_server, handlers, jsonrpc_init_msg):
     assert not manager._listeners["server"]
     assert not manager._listeners["client"]
     assert len(manager._listeners["all"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_server_listener_session_key(manager, echo_spec):
+    """will server listeners hear the key of the session, and only if attached?"""
+    from jupyter_lsp.session import LanguageServerSession
+
+    session = LanguageServerSession(
+        language_server="_echo_", spec=echo_spec, parent=manager
+    )
+    detached = LanguageServerSession(
+        language_server="_detached_", spec=echo_spec, parent=manager
+    )
+    manager.sessions = {"_echo_": session}
+
+    heard = []
+
+    @lsp_message_listener("server")
+    async def server_listener(scope, message, language_server, manager):
+        heard.append(language_server)
+
+    try:
+        await manager.on_server_message('{"jsonrpc": "2.0"}', session)
+        await manager.on_server_message('{"jsonrpc": "2.0"}', detached)
+    finally:
+        manager.unregister_message_listener(server_listener)
+
+    assert heard == ["_echo_"]
@@ -123,3 +123,172 @@ async def test_substitute_env(handlers):
     assert "test-variable" not in os.environ
 
     ws_handler.on_close()
+
+
+@pytest.mark.asyncio
+async def test_ready_after_async_initialize(manager):
+    """will waiters be woken once initialization finishes off the event loop?"""
+    manager.autodetect_cache = False
+    waiter = asyncio.ensure_future(manager.ready())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    await manager.async_initialize()
+
+    assert await asyncio.wait_for(waiter, 5)
+    assert await manager.ready()
+
+
+def test_handler_membership_notifies(manager, echo_spec):
+    """will `handlers` only notify when a handler joins or leaves?"""
+    from jupyter_lsp.session import LanguageServerSession
+
+    from .conftest import MockWebsocketHandler
+
+    session = LanguageServerSession(
+        language_server="_echo_", spec=echo_spec, parent=manager
+    )
+    # don't start (or stop) the (fake) language server as handlers come and go
+    session.unobserve(LanguageServerSession._on_handlers, "handlers")
+    changes = []
+    session.observe(changes.append, "handlers")
+
+    ws_handler = MockWebsocketHandler()
+    session.add_handler(ws_handler)
+    session.add_handler(ws_handler)
+    session.remove_handler(MockWebsocketHandler())
+    assert len(changes) == 1
+
+    session.remove_handler(ws_handler)
+    session.remove_handler(ws_handler)
+    assert [len(change["old"]) for change in changes] == [0, 1]
+    assert not session.handlers
+
+
+def test_reinit_sessions(manager, echo_spec):
+    """will unchanged sessions be kept, and replaced ones be released?"""
+    manager.autodetect = False
+    manager.language_servers = {"_echo_": echo_spec}
+    manager.initialize()
+    session = manager.sessions["_echo_"]
+
+    manager.init_sessions()
+    assert manager.sessions["_echo_"] is session
+
+    manager.language_servers = {"_echo_": {**echo_spec, "languages": ["tlhIngan"]}}
+    manager.init_sessions()
+    assert manager.sessions["_echo_"] is not session
+    assert session.status.value == "stopped"
+
+
+def test_dropped_session_released_on_unsubscribe(manager, echo_spec):
+    """will a dropped session still in use be released by its last handler?"""
+    from .conftest import MockWebsocketHandler
+
+    manager.autodetect = False
+    manager.language_servers = {"_echo_": echo_spec}
+    manager.initialize()
+    session = manager.sessions["_echo_"]
+
+    ws_handler = MockWebsocketHandler()
+    ws_handler.initialize(manager)
+    ws_handler.language_server = "_echo_"
+    # bypass the observer, which would start the (fake) language server
+    session.handlers.add(ws_handler)
+
+    manager.language_servers = {}
+    manager.init_sessions()
+    assert manager.sessions["_echo_"] is session
+
+    manager.unsubscribe(ws_handler)
+    assert "_echo_" not in manager.sessions
+    assert session.status.value == "stopped"
+
+
+def test_changed_session_replaced_on_unsubscribe(manager, echo_spec):
+    """will a session with a changed spec be replaced after its last handler?"""
+    from .conftest import MockWebsocketHandler
+
+    manager.autodetect = False
+    manager.language_servers = {"_echo_": echo_spec}
+    manager.initialize()
+    session = manager.sessions["_echo_"]
+
+    ws_handler = MockWebsocketHandler()
+    ws_handler.initialize(manager)
+    ws_handler.language_server = "_echo_"
+    # bypass the observer, which would start the (fake) language server
+    session.handlers.add(ws_handler)
+
+    changed_spec = {**echo_spec, "languages": ["tlhIngan"]}
+    manager.language_servers = {"_echo_": changed_spec}
+    manager.init_sessions()
+    assert manager.sessions["_echo_"] is session
+
+    manager.unsubscribe(ws_handler)
+    assert manager.sessions["_echo_"] is not session
+    assert manager.sessions["_echo_"].spec == changed_spec
+    assert session.status.value == "stopped"
+
+
+@pytest.mark.asyncio
+async def test_broadcast_serialized_once(manager, echo_spec):
+    """will a non-string message be sent to every handler as the same string?"""
+    from jupyter_lsp.session import LanguageServerSession
+
+    from .conftest import MockWebsocketHandler
+
+    session = LanguageServerSession(
+        language_server="_echo_", spec=echo_spec, parent=manager
+    )
+    manager.sessions = {"_echo_": session}
+
+    ws_handlers = [MockWebsocketHandler(), MockWebsocketHandler()]
+    for ws_handler in ws_handlers:
+        ws_handler.initialize(manager)
+        # bypass the observer, which would start the (fake) language server
+        session.handlers.add(ws_handler)
+
+    await manager.on_server_message({"jsonrpc": "2.0", "id": 0}, session)
+
+    written = [ws_handler._messages_wrote.get_nowait() for ws_handler in ws_handlers]
+    assert written[0] == '{"jsonrpc":"2.0","id":0}'
+    assert written[1] is written[0]
+
+
+@pytest.mark.asyncio
+async def test_broadcast_not_held_by_stalled_handler(manager, echo_spec):
+    """will a handler whose writes never finish not hold back the others?"""
+    from jupyter_lsp.session import LanguageServerSession
+
+    from .conftest import MockWebsocketHandler
+
+    class StalledWebsocketHandler(MockWebsocketHandler):
+        def write_message(self, message):  # type: ignore
+            super().write_message(message)
+            # a write which is never flushed to the socket
+            return asyncio.get_running_loop().create_future()
+
+    session = LanguageServerSession(
+        language_server="_echo_", spec=echo_spec, parent=manager
+    )
+    manager.sessions = {"_echo_": session}
+
+    stalled, healthy = StalledWebsocketHandler(), MockWebsocketHandler()
+    for ws_handler in [stalled, healthy]:
+        ws_handler.initialize(manager)
+        # bypass the observer, which would start the (fake) language server
+        session.handlers.add(ws_handler)
+
+    for message_id in range(2):
+        await asyncio.wait_for(
+            manager.on_server_message(
+                '{{"jsonrpc":"2.0","id":{}}}'.format(message_id), session
+            ),
+            1,
+        )
+
+    assert [healthy._messages_wrote.get_nowait() for _ in range(2)] == [
+        '{"jsonrpc":"2.0","id":0}',
+        '{"jsonrpc":"2.0","id":1}',
+    ]
@@ -150,6 +150,23 @@ async def test_no_shadow_for_well_behaved_server(
     assert not shadow_path_for_well.exists()
 
 
+@pytest.mark.asyncio
+async def test_no_shadow_for_dropped_server(
+    shadow_path,
+):
+    """A session may outlive its language server, which is no longer known"""
+    shadow_path_for_dropped = Path(shadow_path) / "dropped"
+    shadow = setup_shadow_filesystem(shadow_path_for_dropped.as_uri())
+    ok_file_path = Path(shadow_path_for_dropped) / "test.py"
+
+    manager = SimpleNamespace(language_servers={})
+
+    message = did_open(ok_file_path.as_uri(), "content\nof\nopened\nfile")
+    result = await shadow("client", message, "python-lsp-server", manager)
+    assert result is None
+    assert not shadow_path_for_dropped.exists()
+
+
 @pytest.mark.asyncio
 async def test_shadow_created_for_ill_behaved_server(
     shadow_path,
@@ -11,8 +11,9 @@ class Schema(traitlets.Any):
         self._validator = validator
 
     def validate(self, obj, value):
-        errors = list(self._validator.iter_errors(value))
-        if errors:
+        # most values are valid: only collect every error when there is one
+        if next(self._validator.iter_errors(value), None) is not None:
+            errors = list(self._validator.iter_errors(value))
             raise traitlets.TraitError(
                 ("""schema errors:\n""" """\t{}\n""" """for:\n""" """{}""").format(
                     "\n\t".join([error.message for error in errors]), value
@@ -19,7 +19,9 @@ from typing import (
     List,
     Optional,
     Pattern,
+    Sequence,
     Text,
+    Tuple,
     Union,
     cast,
 )
@@ -170,6 +172,12 @@ class HasListeners:
                 if lst.listener != listener
             ]
 
+    def has_listeners(self, scope: MessageScope) -> bool:
+        """whether any listeners are registered for messages in a scope"""
+        return bool(
+            self._listeners[str(scope.value)] or self._listeners[MessageScope.ALL.value]
+        )
+
     async def wait_for_listeners(
         self, scope: MessageScope, message_str: Text, language_server: Text
     ) -> None:
@@ -213,6 +221,33 @@ class LanguageServerManagerAPI(LoggingConfigurable, HasListeners):
         help=_("additional absolute paths to seek node_modules first"),
     ).tag(config=True)
 
+    def __init__(self, **kwargs: Any):
+        self._which_cache: Dict[Text, Optional[Text]] = {}
+        self._check_output_cache: Dict[Tuple[Text, ...], Optional[Text]] = {}
+        super().__init__(**kwargs)
+
+    def which(self, cmd: Text) -> Optional[Text]:
+        """find an executable on $PATH, like `shutil.which`, but only once per
+        manager, as many spec finders look for the same commands
+        """
+        if cmd not in self._which_cache:
+            self._which_cache[cmd] = shutil.which(cmd)
+        return self._which_cache[cmd]
+
+    def check_output(self, argv: Sequence[Text]) -> Optional[Text]:
+        """get the stripped output of a command, e.g. a `--version` probe, only
+        running it once per manager; `None` if the command failed
+        """
+        key = tuple(argv)
+        if key not in self._check_output_cache:
+            output: Optional[Text] = None
+            try:
+                output = subprocess.check_output(key).decode("utf-8").strip()
+            except Exception as e:  # pragma: no cover
+                self.log.debug("Command %s failed: %s", key, e)
+            self._check_output_cache[key] = output
+        return self._check_output_cache[key]
+
     def find_node_module(self, node_module, alternatives):
         """look through the node_module roots to find the given node module"""
         all_roots = self.extra_node_roots + self.node_roots
@@ -237,9 +272,7 @@ class LanguageServerManagerAPI(LoggingConfigurable, HasListeners):
 
     @default("nodejs")
     def _default_nodejs(self):
-        return (
-            shutil.which("node") or shutil.which("nodejs") or shutil.which("nodejs.exe")
-        )
+        return self.which("node") or self.which("nodejs") or self.which("nodejs.exe")
 
     @lru_cache(maxsize=1)
     def _npm_prefix(self, npm: Text):
@@ -280,7 +313,7 @@ class LanguageServerManagerAPI(LoggingConfigurable, HasListeners):
         roots += [pathlib.Path(sys.prefix)]
 
         # check for custom npm prefix
-        npm = shutil.which("npm")
+        npm = self.which("npm")
         if npm:
             prefix = self._npm_prefix(npm)
             if prefix:
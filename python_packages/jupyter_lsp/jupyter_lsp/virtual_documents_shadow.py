@@ -125,7 +125,10 @@ def setup_shadow_filesystem(virtual_documents_uri: str):
         nonlocal initialized
 
         # short-circut if language server does not require documents on disk
-        server_spec = manager.language_servers[language_server]
+        server_spec = manager.language_servers.get(language_server)
+        if server_spec is None:
+            # a session outliving its language server, e.g. after a refresh
+            return
         if not server_spec.get("requires_documents_on_disk", True):
             return
 